@@ -1,11 +1,14 @@
 import sys
 import os
+import re
+import math
 import platform
 import time
 import subprocess
 import tempfile
 import traceback
 import threading 
+import wave
 
 # 🔥 引入 zhconv
 try:
@@ -18,8 +21,8 @@ from PyQt6.QtWidgets import (
     QLabel, QTextEdit, QMessageBox, QFileDialog, QGridLayout, 
     QButtonGroup, QSizePolicy, QFrame
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QRectF
-from PyQt6.QtGui import QFont, QColor, QPainter, QPainterPath, QIcon
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QRectF, QEvent
+from PyQt6.QtGui import QFont, QColor, QPainter, QPainterPath, QIcon, QTextCursor, QPixmap
 
 # ==============================================================================
 # ✅ 全局配置
@@ -29,14 +32,21 @@ if getattr(sys, 'frozen', False):
 else:
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+WHISPER_DIR = os.path.join(BASE_DIR, "tools", "whisper")
+
 IS_MAC = (platform.system() == 'Darwin')
 UI_FONT = "Microsoft YaHei" if not IS_MAC else "PingFang SC"
 
+# 🔥 whisper-cli 默认只开 min(4, 核数) 个线程；大核多的机器按物理核（逻辑核/2）开，最多 8 个，避免挤到超线程/小核上
+_CPU_COUNT = os.cpu_count() or 4
+WHISPER_THREADS = max(min(4, _CPU_COUNT), min(8, _CPU_COUNT // 2))
+
+# 🔥 按顺序找第一个存在的：q8_0 → q5_0 量化模型（体积更小、CPU 上更快），都没有就回退到原版模型
 MODEL_FILE_MAP = {
-    "medium": "ggml-medium.bin",
-    "base": "ggml-base.bin",
-    "large-v3": "ggml-large-v3.bin",
-    "small": "ggml-small.bin",
+    "medium": ("ggml-medium-q8_0.bin", "ggml-medium-q5_0.bin", "ggml-medium.bin"),
+    "base": ("ggml-base-q8_0.bin", "ggml-base-q5_0.bin", "ggml-base.bin"),
+    "large-v3": ("ggml-large-v3-q8_0.bin", "ggml-large-v3-q5_0.bin", "ggml-large-v3.bin"),
+    "small": ("ggml-small-q8_0.bin", "ggml-small-q5_0.bin", "ggml-small.bin"),
 }
 
 PROGRESS_SPEED_MAP = {
@@ -46,6 +56,14 @@ PROGRESS_SPEED_MAP = {
     "large-v3": 0.15
 }
 
+# 🔥 轻量模式用贪心解码（beam=1），解码器少跑 4/5；推荐/深度模式保留 beam=5 保准确率
+BEAM_SIZE_MAP = {
+    "base": 1,
+    "small": 1,
+    "medium": 5,
+    "large-v3": 5
+}
+
 MODEL_OPTIONS = [
     {"name": "🌟 推荐模式", "desc": "均衡首选", "code": "medium", "color": "#2ecc71"},
     {"name": "🧠 深度模式", "desc": "最准但慢", "code": "large-v3", "color": "#00cec9"},
@@ -53,11 +71,77 @@ MODEL_OPTIONS = [
     {"name": "🚀 极速模式", "desc": "飞一般的快", "code": "base", "color": "#3498db"}
 ]
 
+# whisper-cli 每识别完一段会打印 "[00:00:00.000 --> 00:00:05.000]  文本"，结束时间用来算真实进度
+SEGMENT_RE = re.compile(r"^\[[\d:.,]+\s*-->\s*(\d+):(\d+):(\d+)[.,](\d+)\]\s*(.*)$")
+
+# 第一段结果出来之前（模型加载中）假进度最多爬到这里，之后按真实进度走
+LOADING_PROGRESS_CAP = 15.0
+
+# ==============================================================================
+# 📁 模型文件扫描
+# ==============================================================================
+_DIR_SIZE_CACHE = {}
+
+def scan_model_dir(folder):
+    # 🔥 一次 scandir 拿到所有文件大小；目录 mtime 没变就直接复用上次结果，不再逐个 stat
+    try: mtime = os.stat(folder).st_mtime_ns
+    except OSError: return {}
+    cached = _DIR_SIZE_CACHE.get(folder)
+    if cached and cached[0] == mtime: return cached[1]
+    sizes = {}
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(): sizes[entry.name] = entry.stat().st_size
+                except OSError: pass
+    except OSError: return {}
+    # 有 0 字节的文件（可能还在拷贝中）就不缓存，下次重新扫，拷完后能立刻认出来
+    if all(sizes.values()): _DIR_SIZE_CACHE[folder] = (mtime, sizes)
+    return sizes
+
+def resolve_model_file(code):
+    candidates = MODEL_FILE_MAP.get(code, MODEL_FILE_MAP["base"])
+    sizes = scan_model_dir(WHISPER_DIR)
+    return next((f for f in candidates if sizes.get(f)), None)
+
+def wav_duration(path):
+    try:
+        with wave.open(path, "rb") as w: return w.getnframes() / float(w.getframerate())
+    except: return 0.0
+
+def resolve_vad_model():
+    # 新版 whisper.cpp 自带 Silero VAD，放了 ggml-silero-*.bin 就启用
+    names = sorted(n for n in scan_model_dir(WHISPER_DIR) if n.startswith("ggml-silero"))
+    return names[-1] if names else None
+
+_WARM_LOCK = threading.Lock()
+_WARMING = set()
+
+def warm_file_cache(path, keep_going):
+    # 🔥 把模型文件顺序读一遍进系统缓存，whisper-cli 加载时就不用等磁盘；同一个文件正在预热时不重复读
+    # 读完不做记号：系统缓存随时可能被挤掉，下次需要时照样再读一遍（还在缓存里的话很快）
+    with _WARM_LOCK:
+        if path in _WARMING: return
+        _WARMING.add(path)
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while keep_going() and f.read(4 * 1024 * 1024): pass
+    except OSError: pass
+    finally:
+        with _WARM_LOCK: _WARMING.discard(path)
+
 # ==============================================================================
 # 🎨 UI 组件
 # ==============================================================================
 
 class ProgressButton(QPushButton):
+    # 🔥 颜色只解析一次，paintEvent 里直接复用
+    TRACK_COLOR = QColor("#f0f0f0")
+    BAR_COLOR = QColor("#0078d7")
+    TEXT_DARK = QColor("#333")
+    TEXT_LIGHT = QColor("white")
+
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self._progress = 0.0
@@ -65,6 +149,9 @@ class ProgressButton(QPushButton):
         self.default_text = text
         self.format_str = "正在转换... {0}%"
         self._custom_text = None
+        self._paint_font = None
+        self._clip_path = None
+        self._track_pixmap = None
         self.setStyleSheet("""
             QPushButton { 
                 background-color: #0078d7; 
@@ -80,8 +167,12 @@ class ProgressButton(QPushButton):
         """)
 
     def set_progress(self, value):
-        self._progress = float(value)
-        self.update()
+        value = float(value)
+        # 🔥 文字只显示整数、进度条按像素画：两者都没变就不重绘
+        w = self.width()
+        changed = int(value) != int(self._progress) or int(w * value / 100.0) != int(w * self._progress / 100.0)
+        self._progress = value
+        if changed: self.update()
 
     def set_text_override(self, text):
         self._custom_text = text
@@ -102,6 +193,15 @@ class ProgressButton(QPushButton):
         self.setEnabled(True)
         self.update()
 
+    def resizeEvent(self, event):
+        self._clip_path = None
+        self._track_pixmap = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange: self._paint_font = None
+        super().changeEvent(event)
+
     def paintEvent(self, event):
         if not self._is_processing:
             super().paintEvent(event)
@@ -110,25 +210,40 @@ class ProgressButton(QPushButton):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         rect = self.rect()
-        rectf = QRectF(rect)
+        # 🔥 圆角路径只在尺寸变化时重建，背景和进度条裁剪共用同一条
+        if self._clip_path is None:
+            self._clip_path = QPainterPath()
+            self._clip_path.addRoundedRect(QRectF(rect), 22, 22)
+        # 🔥 灰色底槽预先画进 pixmap（按屏幕缩放比），之后每帧只贴图，不再做抗锯齿圆角光栅化
+        dpr = self.devicePixelRatioF()
+        if self._track_pixmap is None or self._track_pixmap.devicePixelRatio() != dpr:
+            # 向上取整：125%/150% 缩放下截断会比圆角路径窄，右下边缘的抗锯齿被切掉
+            pm = QPixmap(math.ceil(rect.width() * dpr), math.ceil(rect.height() * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.GlobalColor.transparent)
+            p = QPainter(pm)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            p.setPen(Qt.PenStyle.NoPen)
+            p.setBrush(self.TRACK_COLOR)
+            p.drawPath(self._clip_path)
+            p.end()
+            self._track_pixmap = pm
+        painter.drawPixmap(0, 0, self._track_pixmap)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor("#f0f0f0"))
-        painter.drawRoundedRect(rectf, 22, 22)
 
         if self._progress > 0:
             prog_width = max(30, (rect.width() * (self._progress / 100.0)))
             if prog_width > rect.width(): prog_width = rect.width()
-            path = QPainterPath()
-            path.addRoundedRect(rectf, 22, 22)
-            painter.setClipPath(path)
-            painter.setBrush(QColor("#0078d7"))
+            painter.setClipPath(self._clip_path)
+            painter.setBrush(self.BAR_COLOR)
             painter.drawRect(0, 0, int(prog_width), int(rect.height()))
             painter.setClipping(False)
 
-        painter.setPen(QColor("#333") if self._progress < 55 else QColor("white"))
-        font = self.font()
-        font.setPointSize(16)
-        painter.setFont(font)
+        painter.setPen(self.TEXT_DARK if self._progress < 55 else self.TEXT_LIGHT)
+        if self._paint_font is None:
+            self._paint_font = self.font()
+            self._paint_font.setPointSize(16)
+        painter.setFont(self._paint_font)
         txt = self._custom_text if self._custom_text else self.format_str.format(int(self._progress))
         painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, txt)
 
@@ -150,13 +265,17 @@ class ModelCard(QPushButton):
         self.l2.setFont(QFont(UI_FONT, 9))
         self.l2.setStyleSheet("color: #666; border: none; background: transparent;")
         layout.addWidget(self.l2)
+        # 🔥 两套样式只依赖颜色，初始化时拼好，切换时直接套用
+        self._selected_css = f"QPushButton {{ background-color: {color}15; border: 2px solid {color}; border-radius: 12px; }}"
+        self._unselected_css = "QPushButton { background-color: #ffffff; border: 1px solid #e0e0e0; border-radius: 12px; } QPushButton:hover { border: 1px solid #bbb; background-color: #fcfcfc; }"
+        self._styled_as = None
         self.update_style(False)
 
     def update_style(self, s):
-        if s:
-            self.setStyleSheet(f"QPushButton {{ background-color: {self.default_color}15; border: 2px solid {self.default_color}; border-radius: 12px; }}")
-        else:
-            self.setStyleSheet("QPushButton { background-color: #ffffff; border: 1px solid #e0e0e0; border-radius: 12px; } QPushButton:hover { border: 1px solid #bbb; background-color: #fcfcfc; }")
+        # 🔥 状态没变就不重设样式，每次点击只重新解析真正变化的那两张卡片
+        if s == self._styled_as: return
+        self._styled_as = s
+        self.setStyleSheet(self._selected_css if s else self._unselected_css)
 
 class ToggleButton(QPushButton):
     def __init__(self, text, parent=None):
@@ -165,9 +284,12 @@ class ToggleButton(QPushButton):
         self.setFixedHeight(45) 
         self.setFont(QFont(UI_FONT, 11))
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self._styled_as = None
         self.update_style(False)
 
     def update_style(self, checked):
+        if checked == self._styled_as: return
+        self._styled_as = checked
         if checked:
             self.setStyleSheet("QPushButton { background-color: #0078d7; color: white; border: none; border-radius: 10px; font-weight: bold; }")
         else:
@@ -176,41 +298,86 @@ class ToggleButton(QPushButton):
 # ==============================================================================
 # ✅ 核心逻辑线程
 # ==============================================================================
+class PrefetchThread(QThread):
+    # 选中模式卡片时就在后台预热模型，点“开始”时基本已经在内存里了
+    def __init__(self, model_path):
+        super().__init__()
+        self.model_path = model_path
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        warm_file_cache(self.model_path, lambda: not self.stop_event.is_set())
+
 class TranscribeThread(QThread):
     status_signal = pyqtSignal(str)
     progress_signal = pyqtSignal(int)
+    segment_signal = pyqtSignal(str)
     result_signal = pyqtSignal(str)
     error_signal = pyqtSignal(str)
+    audio_ready_signal = pyqtSignal(str, str)
 
-    def __init__(self, media_path, model_code):
+    def __init__(self, media_path, model_code, cached_wav=None):
         super().__init__()
         self.media_path = media_path
+        self.cached_wav = cached_wav
         self.model_code = model_code
-        self.is_running = True
+        self.stop_event = threading.Event()
+        self.warm_stop = threading.Event()
         self.proc = None 
+        self.audio_wav = None
         self.speed_step = PROGRESS_SPEED_MAP.get(model_code, 0.3)
+        self.beam_size = BEAM_SIZE_MAP.get(model_code, 5)
+        self._pending_segments = []
+        self._segments_lock = threading.Lock()
+        self._segment_end = 0.0
 
     def stop(self):
-        self.is_running = False
+        self.stop_event.set()
         if self.proc:
             try: self.proc.kill()
             except: pass
 
     def _drain_stdout(self, pipe):
+        # 🔥 边识别边把片段攒起来，由主循环每 0.1s 合并成一次信号推给界面
+        # 单行解析出错只跳过这一行，管道必须一直读空，否则 whisper-cli 写满 stdout 会卡死
         try:
-            for _ in pipe: pass 
+            for line in pipe:
+                try:
+                    m = SEGMENT_RE.match(line.strip())
+                    if not m: continue
+                    h, mi, sec, ms, text = m.groups()
+                    self._segment_end = int(h) * 3600 + int(mi) * 60 + int(sec) + int(ms) / 1000.0
+                    if not text: continue
+                    if zhconv: text = zhconv.convert(text, 'zh-cn')
+                    with self._segments_lock: self._pending_segments.append(text)
+                except: pass
         except: pass
 
+    def _flush_segments(self):
+        with self._segments_lock:
+            if not self._pending_segments: return
+            text = "\n".join(self._pending_segments)
+            self._pending_segments.clear()
+        self.segment_signal.emit(text)
+
+    def _warm_model(self, path):
+        warm_file_cache(path, lambda: not (self.stop_event.is_set() or self.warm_stop.is_set()))
+
     def run(self):
+        tmp_files = []
         try:
             ffmpeg = os.path.join(BASE_DIR, "tools", "ffmpeg", "ffmpeg.exe")
-            whisper_cli = os.path.join(BASE_DIR, "tools", "whisper", "whisper-cli.exe")
-            model_file = MODEL_FILE_MAP.get(self.model_code, "ggml-base.bin")
-            model_path = os.path.join(BASE_DIR, "tools", "whisper", model_file)
+            whisper_cli = os.path.join(WHISPER_DIR, "whisper-cli.exe")
+            model_file = resolve_model_file(self.model_code)
 
+            # whisper-cli 和模型在同一目录，直接查缓存的扫描结果，不再逐个 stat
             if not os.path.exists(ffmpeg): raise Exception("缺少 ffmpeg.exe")
-            if not os.path.exists(whisper_cli): raise Exception("缺少 whisper-cli.exe")
-            if not os.path.exists(model_path): raise Exception(f"缺少模型：{model_file}")
+            if "whisper-cli.exe" not in scan_model_dir(WHISPER_DIR): raise Exception("缺少 whisper-cli.exe")
+            if not model_file: raise Exception(f"缺少模型：{MODEL_FILE_MAP.get(self.model_code, MODEL_FILE_MAP['base'])[-1]}")
+            model_path = os.path.join(WHISPER_DIR, model_file)
 
             startupinfo = None
             if platform.system() == 'Windows':
@@ -218,30 +385,69 @@ class TranscribeThread(QThread):
                 startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
                 startupinfo.wShowWindow = subprocess.SW_HIDE
 
-            self.status_signal.emit("⏳ 正在提取音频...")
             self.progress_signal.emit(5)
-            
-            tmp_wav = os.path.join(tempfile.gettempdir(), f"love_{int(time.time())}.wav")
-            cmd_ff = [ffmpeg, "-y", "-i", self.media_path, "-vn", "-ac", "1", "-ar", "16000", "-f", "wav", tmp_wav]
-            
-            subprocess.run(
-                cmd_ff, 
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-                startupinfo=startupinfo, creationflags=subprocess.CREATE_NO_WINDOW if platform.system()=='Windows' else 0
-            )
 
-            if not os.path.exists(tmp_wav): raise Exception("音频提取失败")
-            if not self.is_running: return
+            # 🔥 同一个文件换模式重跑时，直接复用上次提取好的 wav，省掉一整遍 ffmpeg 解码
+            if self.cached_wav and os.path.exists(self.cached_wav):
+                tmp_wav = self.cached_wav
+            else:
+                self.status_signal.emit("⏳ 正在提取音频...")
+                tmp_wav = os.path.join(tempfile.gettempdir(), f"love_{int(time.time() * 1000)}.wav")
+                tmp_files.append(tmp_wav)
+
+                # 🔥 ffmpeg 提取音频的同时把模型读进系统缓存；whisper-cli 启动前叫停，不跟它抢磁盘
+                warm = threading.Thread(target=self._warm_model, args=(model_path,))
+                warm.daemon = True
+                warm.start()
+
+                cmd_ff = [ffmpeg, "-y", "-i", self.media_path, "-vn", "-ac", "1", "-ar", "16000", "-f", "wav", tmp_wav]
+
+                # 🔥 用 Popen 挂到 self.proc 上，关窗口时 stop() 能直接杀掉 ffmpeg
+                if self.stop_event.is_set(): return
+                self.proc = subprocess.Popen(
+                    cmd_ff,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    startupinfo=startupinfo, creationflags=subprocess.CREATE_NO_WINDOW if platform.system()=='Windows' else 0
+                )
+                # stop() 可能刚好落在 Popen 返回之前，那时 self.proc 还没挂上，这里补杀一次
+                if self.stop_event.is_set(): self.proc.kill()
+                self.proc.communicate()
+
+                if self.stop_event.is_set(): return
+                # ffmpeg 失败时可能留下半截 wav：不进缓存，留在 tmp_files 里由 finally 删掉
+                if self.proc.returncode != 0 or not os.path.exists(tmp_wav): raise Exception("音频提取失败")
+                # 提取成功的 wav 交给主窗口缓存，由它负责删除
+                tmp_files.remove(tmp_wav)
+                self.audio_wav = tmp_wav
+                self.audio_ready_signal.emit(self.media_path, tmp_wav)
 
             self.status_signal.emit("🧠 正在AI思考中...")
             out_prefix = os.path.join(tempfile.gettempdir(), f"love_out_{int(time.time())}")
             out_txt = out_prefix + ".txt"
+            tmp_files.append(out_txt)
             
             cmd_wh = [
                 whisper_cli, "-m", model_path, "-f", tmp_wav, 
-                "-l", "zh", "-otxt", "-of", out_prefix
+                "-l", "zh", "-t", str(WHISPER_THREADS), "-bs", str(self.beam_size), "-otxt", "-of", out_prefix,
+                # 🔥 -mc 0：不把前文塞回解码器（condition_on_previous_text=False），长音频后半段不再越跑越慢
+                "-mc", "0"
             ]
 
+            # 🔥 贪心模式下温度回退也只采 1 个候选（默认 5 个），难段落重试不再拖慢整体
+            if self.beam_size == 1: cmd_wh += ["-bo", "1"]
+
+            # 🔥 有 VAD 模型就先切掉静音段，静音不再送进编码器
+            vad_model = resolve_vad_model()
+            if vad_model:
+                cmd_wh += [
+                    "--vad", "-vm", os.path.join(WHISPER_DIR, vad_model),
+                    "--vad-threshold", "0.5", "--vad-min-silence-duration-ms", "500",
+                    # 语音段前后各留 200ms，避免切掉句首句尾的字
+                    "--vad-speech-pad-ms", "200"
+                ]
+
+            self.warm_stop.set()
+            if self.stop_event.is_set(): return
             self.proc = subprocess.Popen(
                 cmd_wh,
                 stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
@@ -249,22 +455,40 @@ class TranscribeThread(QThread):
                 text=True, encoding="utf-8", errors="replace",
                 startupinfo=startupinfo, creationflags=subprocess.CREATE_NO_WINDOW if platform.system()=='Windows' else 0
             )
+            if self.stop_event.is_set(): self.proc.kill()
 
             t = threading.Thread(target=self._drain_stdout, args=(self.proc.stdout,))
             t.daemon = True
             t.start()
 
+            duration = wav_duration(tmp_wav)
             current_prog = 5.0
+            last_emitted = 5
             
             while True:
-                if self.proc.poll() is not None: break
-                if not self.is_running: 
+                if self.stop_event.is_set():
                     self.proc.kill()
                     return
-                if current_prog < 99.0:
+                # 🔥 有片段出来后按“已识别到的时间 / 总时长”算真实进度；之前只在加载阶段小幅爬升
+                if self._segment_end > 0 and duration > 0:
+                    current_prog = max(current_prog, min(99.0, 5.0 + 94.0 * self._segment_end / duration))
+                elif current_prog < (LOADING_PROGRESS_CAP if duration > 0 else 99.0):
                     current_prog += self.speed_step
-                    self.progress_signal.emit(int(current_prog))
-                time.sleep(0.1) 
+                # 🔥 整数百分比没变就不发信号，省掉跨线程排队和按钮重绘
+                if int(current_prog) != last_emitted:
+                    last_emitted = int(current_prog)
+                    self.progress_signal.emit(last_emitted)
+                self._flush_segments()
+                # 🔥 阻塞等进程结束（最多 0.1s），一退出立刻往下走，不再傻睡
+                try:
+                    self.proc.wait(timeout=0.1)
+                    break
+                except subprocess.TimeoutExpired: pass
+
+            t.join(1.0)
+            # 进程是被 stop() 杀掉才退出的：静默收尾，不报“意外中断”
+            if self.stop_event.is_set(): return
+            self._flush_segments()
 
             if self.proc.returncode != 0: 
                 if not os.path.exists(out_txt): raise Exception("识别意外中断，未生成结果")
@@ -278,15 +502,20 @@ class TranscribeThread(QThread):
             if zhconv:
                 final_text = zhconv.convert(raw_text, 'zh-cn')
 
-            try: os.remove(tmp_wav); os.remove(out_txt)
-            except: pass
-
             self.progress_signal.emit(100) 
             self.status_signal.emit("✅ 转换完成")
             self.result_signal.emit(final_text)
 
         except Exception as e:
             self.error_signal.emit(str(e))
+        finally:
+            # 🔥 成功、出错、中途取消都会走到这里：等子进程退干净再删临时文件，Temp 里不再残留大 wav
+            if self.proc:
+                try: self.proc.wait(timeout=2)
+                except: pass
+            for path in tmp_files:
+                try: os.remove(path)
+                except: pass
 
 # ==============================================================================
 # ✅ 主窗口 (修复高度布局)
@@ -300,8 +529,12 @@ class MainWindow(QWidget):
         self.media_path = ""
         self.selected_model = "medium"
         self.full_raw_text = ""
+        self.display_text = ""
         self.model_btns = []
         self.worker = None 
+        self.prefetcher = None
+        self.audio_cache = None
+        self.closing = False
         
         icon_path = os.path.join(BASE_DIR, "icon.ico")
         if os.path.exists(icon_path):
@@ -353,7 +586,8 @@ class MainWindow(QWidget):
             grid.addWidget(b, i // 2, i % 2)
             self.model_btns.append(b)
         left_layout.addLayout(grid)
-        self.on_model_click(self.model_btns[0])
+        # 启动时只选中默认卡片，不预热：等用户真正点卡片或选好文件再读模型
+        self.on_model_click(self.model_btns[0], prefetch=False)
 
         left_layout.addSpacing(15)
 
@@ -381,6 +615,7 @@ class MainWindow(QWidget):
         # 1. 文本框
         self.txt = QTextEdit()
         self.txt.setPlaceholderText("转换结果将显示在这里...")
+        self.txt.setAcceptRichText(False)
         self.txt.setFont(QFont(UI_FONT, 11))
         # 🔥 修改点 2：删除了 setMaximumHeight。
         # 让它默认拉伸，但是因为下面没有弹簧，它会占据所有“剩余空间”。
@@ -439,11 +674,25 @@ class MainWindow(QWidget):
         for btn in self.model_btns:
             pass 
 
-    def on_model_click(self, b):
+    def on_model_click(self, b, prefetch=True):
         for x in self.model_btns:
             x.setChecked(x == b)
             x.update_style(x == b)
         self.selected_model = b.code
+        if prefetch: self.prefetch_model()
+
+    def prefetch_model(self):
+        # 识别进行中不预热：别跟 whisper-cli 抢磁盘，也不在界面线程上等旧的预热线程
+        if self.worker and self.worker.isRunning(): return
+        model_file = resolve_model_file(self.selected_model)
+        model_path = os.path.join(WHISPER_DIR, model_file) if model_file else None
+        if self.prefetcher and self.prefetcher.isRunning():
+            if self.prefetcher.model_path == model_path: return
+            self.prefetcher.stop()
+            self.prefetcher.wait()
+        if not model_path: return
+        self.prefetcher = PrefetchThread(model_path)
+        self.prefetcher.start()
 
     def on_format_change(self, btn):
         self.btn_mode_lines.update_style(self.btn_mode_lines.isChecked())
@@ -459,22 +708,58 @@ class MainWindow(QWidget):
         f, _ = QFileDialog.getOpenFileName(self, "选择文件", "", "Media (*.mp4 *.mov *.avi *.mkv *.mp3 *.wav *.m4a)")
         if f: self.load(f)
 
+    def media_key(self, p):
+        try:
+            st = os.stat(p)
+            return (p, st.st_mtime_ns, st.st_size)
+        except OSError: return None
+
+    def on_audio_ready(self, media_path, wav_path):
+        # 信号是排队送达的：窗口已经在关闭（缓存已清过）就直接删掉，不再入缓存
+        key = None if self.closing else self.media_key(media_path)
+        if key:
+            self.drop_audio_cache()
+            self.audio_cache = (key, wav_path)
+        else:
+            try: os.remove(wav_path)
+            except: pass
+
+    def drop_audio_cache(self):
+        if self.audio_cache:
+            try: os.remove(self.audio_cache[1])
+            except: pass
+        self.audio_cache = None
+
     def load(self, p):
+        # 识别进行中 whisper-cli 可能正在读缓存的 wav，先不删；下次提取新音频时 on_audio_ready 会替换掉它
+        busy = self.worker and self.worker.isRunning()
+        if self.audio_cache and self.audio_cache[0][0] != p and not busy: self.drop_audio_cache()
         self.media_path = p
         self.btn_import.setText(f"\n✅ 已加载:\n{os.path.basename(p)}\n")
         self.btn_import.setStyleSheet(self.btn_import.styleSheet().replace("#fcfcfc", "#e8f5e9").replace("#aaa", "#2ecc71"))
-        self.btn_start.setEnabled(True)
-        self.lbl_stat.setText("准备就绪")
+        # 识别中换文件只记下路径，开始按钮等这一轮结束后由 reset_ui 放开
+        if not busy:
+            self.btn_start.setEnabled(True)
+            self.lbl_stat.setText("准备就绪")
+        # 🔥 选好文件时顺手预热当前模型（识别进行中拖入文件不会预热，prefetch_model 里会直接返回）
+        self.prefetch_model()
 
     def start(self):
         self.btn_start.start_processing()
         self.btn_import.setEnabled(False)
         self.txt.clear()
+        # 🔥 识别期间关掉撤销栈，逐段插入不再记录撤销历史；结束后在 reset_ui 里恢复
+        self.txt.document().setUndoRedoEnabled(False)
         self.full_raw_text = ""
+        self.display_text = ""
         
-        self.worker = TranscribeThread(self.media_path, self.selected_model)
+        key = self.media_key(self.media_path)
+        cached_wav = self.audio_cache[1] if self.audio_cache and key and self.audio_cache[0] == key else None
+        self.worker = TranscribeThread(self.media_path, self.selected_model, cached_wav)
+        self.worker.audio_ready_signal.connect(self.on_audio_ready)
         self.worker.status_signal.connect(self.lbl_stat.setText)
         self.worker.progress_signal.connect(self.btn_start.set_progress)
+        self.worker.segment_signal.connect(self.append_segment)
         self.worker.result_signal.connect(self.done)
         self.worker.error_signal.connect(self.fail)
         self.worker.start()
@@ -485,14 +770,20 @@ class MainWindow(QWidget):
         self.lbl_stat.setText("转换完成")
         self.reset_ui()
 
+    def append_segment(self, text):
+        cursor = self.txt.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text + "\n")
+
     def update_text_display(self):
         if not self.full_raw_text: return
         if self.btn_mode_lines.isChecked():
-            self.txt.setPlainText(self.full_raw_text)
+            self.display_text = self.full_raw_text
         else:
-            clean_text = self.full_raw_text.replace('\n', '，').replace('\r', '')
-            while "，，" in clean_text: clean_text = clean_text.replace("，，", "，")
-            self.txt.setPlainText(clean_text)
+            # 🔥 换行变逗号后用一次正则合并连续逗号，替代 while 里反复 replace("，，") 的整串拷贝，结果完全一样
+            self.display_text = re.sub("，{2,}", "，", self.full_raw_text.replace("\r", "").replace("\n", "，"))
+        self.txt.setPlainText(self.display_text)
+        self.txt.document().setModified(False)
 
     def fail(self, err):
         self.lbl_stat.setText("出错")
@@ -503,16 +794,31 @@ class MainWindow(QWidget):
     def reset_ui(self):
         self.btn_start.stop_processing()
         self.btn_import.setEnabled(True)
+        self.txt.document().setUndoRedoEnabled(True)
 
     def copy_result(self):
-        self.txt.selectAll()
-        self.txt.copy()
+        # 🔥 用户没改过文本就直接复制缓存好的字符串，不用再遍历整个文档
+        if self.display_text and not self.txt.document().isModified():
+            QApplication.clipboard().setText(self.display_text)
+        else:
+            QApplication.clipboard().setText(self.txt.toPlainText())
         self.lbl_stat.setText("已复制")
 
     def closeEvent(self, event):
+        self.closing = True
+        # 🔥 两个线程都是先 stop() 再等它自己退出：预热每读 4MB 查一次停止标记，
+        # 识别线程的子进程已被杀掉，finally 里清完临时文件就会结束，不会卡住
+        if self.prefetcher and self.prefetcher.isRunning():
+            self.prefetcher.stop()
+            self.prefetcher.wait()
         if self.worker and self.worker.isRunning():
             self.worker.stop()
-            self.worker.wait(200)
+            self.worker.wait()
+        # 刚提取好的 wav 的信号可能还排在队列里没送到，按线程自己记下的路径删
+        if self.worker and self.worker.audio_wav:
+            try: os.remove(self.worker.audio_wav)
+            except: pass
+        self.drop_audio_cache()
         event.accept()
 
 # 🔥 启用高分屏适配